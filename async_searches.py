@@ -0,0 +1,174 @@
+from math import inf as infinity
+
+from structures.graphs import GraphPath
+from structures.async_graphs import AsyncGraphNode
+from structures.collections_ import PriorityQueue
+from searches import _get_path_by_parents
+
+
+class AsyncShortestPaths:
+    """
+    Shortest paths from one AsyncGraphNode, stored as distances and parents of
+    nodes, so they take no adjacency to keep. Builds the abstract graph of a
+    path only on request, loading the nodes of that path.
+    """
+
+    def __init__(
+        self,
+        starting_graph_node: AsyncGraphNode,
+        distance_to_node: dict[AsyncGraphNode, float | int],
+        parent_by_node: dict[AsyncGraphNode, AsyncGraphNode | None]
+    ) -> None:
+        self.__starting_node = starting_graph_node
+        self.__distance_to_node = distance_to_node
+        self.__parent_by_node = parent_by_node
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(starting_node={self.__starting_node}, reachable={len(self.__distance_to_node)})"
+
+    @property
+    def starting_node(self) -> AsyncGraphNode:
+        return self.__starting_node
+
+    @property
+    def nodes(self) -> frozenset[AsyncGraphNode,]:
+        return frozenset(self.__distance_to_node.keys())
+
+    def get_distance_to(self, graph_node: AsyncGraphNode) -> float | int:
+        return self.__distance_to_node.get(graph_node, infinity)
+
+    def get_intermediate_keys_to(self, graph_node: AsyncGraphNode) -> tuple | None:
+        """Returns None if no path was found, otherwise data of the path nodes after the starting one."""
+
+        if graph_node not in self.__parent_by_node:
+            return None
+
+        intermediate_keys = list()
+
+        while graph_node is not self.__starting_node:
+            intermediate_keys.append(graph_node.data)
+            graph_node = self.__parent_by_node[graph_node]
+
+        return tuple(reversed(intermediate_keys))
+
+    async def get_path_to(self, graph_node: AsyncGraphNode) -> GraphPath | None:
+        """
+        Returns None if no path was found, otherwise abstract graph of the path.
+        Its nodes may be unloaded later by their loader, after which they can be
+        loaded again with loader.load_nodes_of(path.nodes).
+        """
+
+        if graph_node not in self.__parent_by_node:
+            return None
+
+        return await _get_loaded_path_by_parents(self.__starting_node, graph_node, self.__parent_by_node)
+
+
+async def async_breadth_first_search(
+    starting_graph_node: AsyncGraphNode,
+    final_graph_node: AsyncGraphNode
+) -> GraphPath | None:
+    """
+    Searches for a path from one graph node to another, spending the minimum
+    number of steps, like breadth_first_search. Loads neighboring nodes of the
+    whole next level of the search at once, so their fetches are batched and run
+    concurrently, no more than loader.cache_size nodes at a time. Returns None if
+    no path exists, otherwise abstract graph of the path. O(n + e) speed, where e
+    is the number of transitions.
+    """
+
+    loader = starting_graph_node.loader
+    parent_by_node = {starting_graph_node: None}
+    level_nodes = [starting_graph_node]
+
+    while level_nodes:
+        if final_graph_node in level_nodes:
+            return await _get_loaded_path_by_parents(starting_graph_node, final_graph_node, parent_by_node)
+
+        next_level_nodes = list()
+
+        for part_start in range(0, len(level_nodes), loader.cache_size):
+            level_part = level_nodes[part_start:part_start + loader.cache_size]
+            await loader.load_nodes_of(level_part)
+
+            for active_node in level_part:
+                for next_node in active_node.nodes:
+                    if next_node not in parent_by_node:
+                        parent_by_node[next_node] = active_node
+                        next_level_nodes.append(next_node)
+
+        level_nodes = next_level_nodes
+
+
+async def async_get_optinal_paths_to_graph_nodes(
+    starting_graph_node: AsyncGraphNode,
+    maximum_distance: float | int = infinity,
+    prefetch_size: int = 64
+) -> AsyncShortestPaths:
+    """
+    Finds paths with the smallest sum of intermediate data to all nodes not
+    farther than maximum_distance, using Dijkstra's algorithm. When the next node
+    to expand is not loaded, loads it together with up to prefetch_size nearest
+    discovered nodes that are not loaded yet, so the fetches overlap with each
+    other. O(e*log(n)) speed.
+
+    Returns distances and parents of the found nodes as AsyncShortestPaths,
+    which builds the abstract graph of a path to a node on request.
+    """
+
+    prefetch_size = min(prefetch_size, starting_graph_node.loader.cache_size - 1)
+
+    parent_by_node = {starting_graph_node: None}
+    distance_to_node = {starting_graph_node: 0}
+    settled_nodes = set()
+    nodes_to_check = PriorityQueue([(starting_graph_node, 0)])
+    nodes_to_prefetch = PriorityQueue()
+
+    while nodes_to_check:
+        active_node = nodes_to_check.get()
+
+        if active_node in settled_nodes:
+            continue
+
+        settled_nodes.add(active_node)
+
+        if not active_node.is_loaded:
+            prefetched_nodes = {active_node}
+
+            while nodes_to_prefetch and len(prefetched_nodes) <= prefetch_size:
+                node, distance = nodes_to_prefetch.get()
+
+                if node not in settled_nodes and not node.is_loaded and distance == distance_to_node[node]:
+                    prefetched_nodes.add(node)
+
+            await active_node.loader.load_nodes_of(prefetched_nodes)
+
+        for next_node in active_node.nodes:
+            next_distance = distance_to_node[active_node] + active_node.get_intermediate_data_from(next_node)
+
+            if next_distance <= maximum_distance and next_distance < distance_to_node.get(next_node, infinity):
+                distance_to_node[next_node] = next_distance
+                parent_by_node[next_node] = active_node
+                nodes_to_check.add(next_node, next_distance)
+
+                if not next_node.is_loaded:
+                    nodes_to_prefetch.add((next_node, next_distance), next_distance)
+
+    return AsyncShortestPaths(starting_graph_node, distance_to_node, parent_by_node)
+
+
+async def _get_loaded_path_by_parents(
+    starting_graph_node: AsyncGraphNode,
+    final_graph_node: AsyncGraphNode,
+    parent_by_node: dict[AsyncGraphNode, AsyncGraphNode | None]
+) -> GraphPath:
+    path_nodes = list()
+    active_node = parent_by_node[final_graph_node]
+
+    while active_node is not None:
+        path_nodes.append(active_node)
+        active_node = parent_by_node[active_node]
+
+    await starting_graph_node.loader.load_nodes_of(path_nodes)
+
+    return _get_path_by_parents(starting_graph_node, final_graph_node, parent_by_node)
@@ -0,0 +1,237 @@
+from typing import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, Future
+from array import array
+from math import inf as infinity
+from os import cpu_count
+
+from structures.graphs import AbstractGraphNode, HashGraphNode
+from structures.data_types import DistanceMatrix
+from structures.collections_ import Queue, PriorityQueue
+
+
+class FlatGraph:
+    """
+    Graph reachable from the input nodes, stored in flat arrays of node indexes
+    (compressed sparse rows) instead of linked node objects. Distances between
+    nodes are taken from intermediate data of HashGraphNodes, transitions from
+    other nodes cost 0, as get_all_intermediate_data of GraphPath counts them.
+    Does not store the nodes themselves, so it is cheap to pass to other
+    processes.
+    """
+
+    def __init__(self, offsets: array, neighbour_indexes: array, weights: array) -> None:
+        self.__offsets = offsets
+        self.__neighbour_indexes = neighbour_indexes
+        self.__weights = weights
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(nodes={len(self)}, edges={len(self.__neighbour_indexes)})"
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (self.__offsets, self.__neighbour_indexes, self.__weights))
+
+    @classmethod
+    def created_from(
+        cls,
+        starting_graph_nodes: Iterable[AbstractGraphNode,]
+    ) -> tuple["FlatGraph", tuple[AbstractGraphNode,]]:
+        """Returns the flat graph and its nodes in the order of their indexes."""
+
+        nodes = list()
+        index_by_node = dict()
+        nodes_to_check = Queue()
+
+        for node in starting_graph_nodes:
+            if node not in index_by_node:
+                index_by_node[node] = len(nodes)
+                nodes.append(node)
+                nodes_to_check.add(node)
+
+        offsets, neighbour_indexes, weights = array('q', [0]), array('q'), array('d')
+
+        while nodes_to_check:
+            active_node = nodes_to_check.get()
+
+            for next_node in active_node.nodes:
+                if next_node not in index_by_node:
+                    index_by_node[next_node] = len(nodes)
+                    nodes.append(next_node)
+                    nodes_to_check.add(next_node)
+
+                neighbour_indexes.append(index_by_node[next_node])
+                weights.append(
+                    active_node.get_intermediate_data_from(next_node)
+                    if isinstance(active_node, HashGraphNode) else 0
+                )
+
+            offsets.append(len(neighbour_indexes))
+
+        return cls(offsets, neighbour_indexes, weights), tuple(nodes)
+
+    def get_step_distances_from(self, node_index: int) -> array:
+        """
+        Returns the minimum number of steps to each node, as breadth_first_search
+        counts them. O(n + e) speed, where e is the number of transitions.
+        """
+
+        distances = array('d', [infinity]) * len(self)
+        distances[node_index] = 0
+        nodes_to_check = [node_index]
+
+        for active_index in nodes_to_check:
+            for edge_index in range(self.__offsets[active_index], self.__offsets[active_index + 1]):
+                next_index = self.__neighbour_indexes[edge_index]
+
+                if distances[next_index] == infinity:
+                    distances[next_index] = distances[active_index] + 1
+                    nodes_to_check.append(next_index)
+
+        return distances
+
+    def get_weighted_distances_from(self, node_index: int) -> array:
+        """
+        Returns the minimum sum of transition distances to each node, as the
+        default comparison of get_optinal_paths_to_graph_nodes chooses them, so
+        transitions from nodes other than HashGraphNodes add nothing. Use
+        get_step_distances_from for such graphs. Uses Dijkstra's algorithm.
+        O(e*log(n)) speed.
+        """
+
+        distances = array('d', [infinity]) * len(self)
+        distances[node_index] = 0
+        nodes_to_check = PriorityQueue([((node_index, 0), 0)])
+
+        while nodes_to_check:
+            active_index, distance = nodes_to_check.get()
+
+            if distance > distances[active_index]:
+                continue
+
+            for edge_index in range(self.__offsets[active_index], self.__offsets[active_index + 1]):
+                next_index = self.__neighbour_indexes[edge_index]
+                next_distance = distance + self.__weights[edge_index]
+
+                if next_distance < distances[next_index]:
+                    distances[next_index] = next_distance
+                    nodes_to_check.add((next_index, next_distance), next_distance)
+
+        return distances
+
+
+_worker_graph: FlatGraph | None = None
+
+
+def iterate_distances_from(
+    starting_graph_nodes: Iterable[AbstractGraphNode,],
+    is_weighted: bool = True,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+    max_pending_chunks: int | None = None,
+) -> Iterator[tuple[AbstractGraphNode, dict[AbstractGraphNode, float | int]],]:
+    """
+    Lazily yields each input starting node with distances to the nodes reachable
+    from it, in the order of the input nodes. Distances are sums of
+    intermediate data of HashGraphNodes if is_weighted, otherwise numbers of
+    steps, which should be used for graphs of other nodes.
+
+    Searches run in max_workers processes, each of which receives the graph once
+    as FlatGraph. Starting nodes are sent to the processes in chunks of
+    chunk_size and no more than max_pending_chunks chunks (twice the number of
+    processes by default) are computed ahead of the consumer.
+    """
+
+    for starting_nodes, nodes, rows in _iterate_distance_rows(
+        tuple(starting_graph_nodes),
+        is_weighted,
+        max_workers,
+        chunk_size,
+        max_pending_chunks
+    ):
+        for starting_node, row in zip(starting_nodes, rows):
+            yield starting_node, {
+                node: distance
+                for node, distance in zip(nodes, row)
+                if distance != infinity
+            }
+
+
+def get_distance_matrix(
+    starting_graph_nodes: Iterable[AbstractGraphNode,],
+    is_weighted: bool = True,
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+) -> DistanceMatrix:
+    """
+    Returns distances from each input starting node to each node reachable from
+    them as one row of floats per starting node (infinity for unreachable nodes),
+    computed in parallel as in iterate_distances_from.
+    """
+
+    starting_graph_nodes = tuple(starting_graph_nodes)
+    nodes, distances = tuple(), list()
+
+    for _, nodes, rows in _iterate_distance_rows(starting_graph_nodes, is_weighted, max_workers, chunk_size):
+        distances.extend(rows)
+
+    return DistanceMatrix(starting_graph_nodes, nodes, tuple(distances))
+
+
+def _iterate_distance_rows(
+    starting_graph_nodes: tuple[AbstractGraphNode,],
+    is_weighted: bool,
+    max_workers: int | None,
+    chunk_size: int,
+    max_pending_chunks: int | None = None,
+) -> Iterator[tuple[tuple[AbstractGraphNode,], tuple[AbstractGraphNode,], list[array,]],]:
+    if not starting_graph_nodes:
+        return
+
+    flat_graph, nodes = FlatGraph.created_from(starting_graph_nodes)
+    index_by_node = {node: index for index, node in enumerate(nodes)}
+
+    max_workers = max_workers or cpu_count() or 1
+    max_pending_chunks = max_pending_chunks or 2 * max_workers
+
+    chunks = [
+        starting_graph_nodes[chunk_start:chunk_start + chunk_size]
+        for chunk_start in range(0, len(starting_graph_nodes), chunk_size)
+    ]
+    pending_chunks = Queue()
+
+    with ProcessPoolExecutor(max_workers, initializer=_set_worker_graph, initargs=(flat_graph, )) as executor:
+        for chunk in chunks:
+            if len(pending_chunks) >= max_pending_chunks:
+                yield _get_rows_of(pending_chunks.get(), nodes)
+
+            pending_chunks.add((
+                chunk,
+                executor.submit(_get_distance_rows, tuple(map(index_by_node.get, chunk)), is_weighted)
+            ))
+
+        while pending_chunks:
+            yield _get_rows_of(pending_chunks.get(), nodes)
+
+
+def _get_rows_of(
+    pending_chunk: tuple[tuple[AbstractGraphNode,], Future],
+    nodes: tuple[AbstractGraphNode,]
+) -> tuple[tuple[AbstractGraphNode,], tuple[AbstractGraphNode,], list[array,]]:
+    chunk, future = pending_chunk
+
+    return chunk, nodes, future.result()
+
+
+def _set_worker_graph(flat_graph: FlatGraph) -> None:
+    global _worker_graph
+    _worker_graph = flat_graph
+
+
+def _get_distance_rows(node_indexes: tuple[int,], is_weighted: bool) -> list[array,]:
+    get_distances_from = (
+        _worker_graph.get_weighted_distances_from if is_weighted else _worker_graph.get_step_distances_from
+    )
+
+    return list(map(get_distances_from, node_indexes))
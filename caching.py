@@ -0,0 +1,115 @@
+from typing import Callable, Hashable
+from collections import OrderedDict
+from dataclasses import dataclass
+from copy import copy
+
+from structures.graphs import AbstractGraphNode, GraphNode, HashGraphNode, GraphPath, get_reachable_nodes_from
+from structures.data_types import CacheStatistics
+from searches import breadth_first_search, get_optinal_paths_to_graph_nodes
+
+
+@dataclass
+class _CacheEntry:
+    result: any
+    node_versions: tuple[tuple[AbstractGraphNode, int],]
+    checked_graph_version: int
+
+
+class PathCache:
+    """
+    Remembers results of path searches from the same starting nodes. Keeps at most
+    max_size results, forgetting the least recently used ones first.
+
+    A result is considered actual while none of the nodes reachable from its
+    starting node has changed. Changes are detected by the node versions, so when
+    no graph has changed since the last check, the result is returned in O(1)
+    speed, otherwise in O(n) speed, where n is the number of reachable nodes.
+    Returned paths are copies, so changing them does not affect the cache.
+    """
+
+    def __init__(self, max_size: int = 128, path_comparison_function: Callable | None = None) -> None:
+        self.__max_size = max_size
+        self.__path_comparison_function = path_comparison_function
+        self.__entries = OrderedDict()
+        self.__hits = self.__misses = self.__invalidations = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)}, max_size={self.__max_size})"
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(self.__hits, self.__misses, self.__invalidations)
+
+    def get_optinal_paths_from(self, starting_graph_node: GraphNode) -> dict[HashGraphNode, GraphPath]:
+        """Cached version of get_optinal_paths_to_graph_nodes."""
+
+        paths_to_nodes = self.__get_result(
+            ("optinal_paths", starting_graph_node),
+            starting_graph_node,
+            lambda: get_optinal_paths_to_graph_nodes(starting_graph_node, self.__path_comparison_function)
+        )
+
+        return {node: copy(path) for node, path in paths_to_nodes.items()}
+
+    def get_path_between(
+        self,
+        starting_graph_node: AbstractGraphNode,
+        final_graph_node: AbstractGraphNode
+    ) -> GraphPath | None:
+        """Cached version of breadth_first_search."""
+
+        path = self.__get_result(
+            ("breadth_first_path", starting_graph_node, final_graph_node),
+            starting_graph_node,
+            lambda: breadth_first_search(starting_graph_node, final_graph_node)
+        )
+
+        return None if path is None else copy(path)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    def __get_result(self, key: Hashable, starting_graph_node: AbstractGraphNode, search: Callable) -> any:
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            if self.__is_entry_actual(entry):
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+
+                return entry.result
+
+            self.__invalidations += 1
+            del self.__entries[key]
+
+        self.__misses += 1
+
+        graph_version = AbstractGraphNode.get_graph_version()
+        entry = _CacheEntry(
+            search(),
+            tuple((node, node.version) for node in get_reachable_nodes_from((starting_graph_node, ))),
+            graph_version
+        )
+
+        self.__entries[key] = entry
+
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+        return entry.result
+
+    def __is_entry_actual(self, entry: _CacheEntry) -> bool:
+        graph_version = AbstractGraphNode.get_graph_version()
+
+        if entry.checked_graph_version == graph_version:
+            return True
+
+        if any(node.version != version for node, version in entry.node_versions):
+            return False
+
+        entry.checked_graph_version = graph_version
+        return True
+
@@ -0,0 +1,155 @@
+from math import inf as infinity
+from collections import defaultdict
+
+from structures.graphs import HashGraphNode, GraphPath
+from structures.collections_ import PriorityQueue
+from searches import _get_path_by_parents
+
+
+class DynamicShortestPaths:
+    """
+    Keeps the paths with the smallest sum of intermediate data from one starting
+    node to all reachable nodes of a graph of HashGraphNodes and keeps them
+    optimal while the graph changes.
+
+    Changes must be made through add_node and cut_node of this object. After
+    a transition becomes shorter, only the nodes whose paths become shorter are
+    updated; after a transition becomes longer or disappears, only the subtree of
+    paths going through it is recomputed, in the style of dynamic Dijkstra's
+    algorithm. O(a*log(a)) speed per change, where a is the number of affected
+    nodes and their transitions.
+    """
+
+    def __init__(self, starting_graph_node: HashGraphNode) -> None:
+        self.__starting_node = starting_graph_node
+        self.__distances = {starting_graph_node: 0}
+        self.__parents = {starting_graph_node: None}
+        self.__children = defaultdict(set)
+        self.__incoming_nodes = defaultdict(set)
+        self.__registered_nodes = set()
+
+        self.__spread_decreases(PriorityQueue([((starting_graph_node, 0), 0)]))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(starting_node={self.__starting_node}, reachable={len(self.__distances)})"
+
+    @property
+    def starting_node(self) -> HashGraphNode:
+        return self.__starting_node
+
+    @property
+    def reachable_nodes(self) -> frozenset[HashGraphNode,]:
+        return frozenset(self.__distances.keys())
+
+    def get_distance_to(self, graph_node: HashGraphNode) -> float | int:
+        return self.__distances.get(graph_node, infinity)
+
+    def get_path_to(self, graph_node: HashGraphNode) -> GraphPath | None:
+        """Returns None if no path exists, otherwise abstract graph of the path."""
+
+        if graph_node not in self.__distances:
+            return None
+
+        return _get_path_by_parents(self.__starting_node, graph_node, self.__parents)
+
+    def add_node(self, graph_node: HashGraphNode, next_graph_node: HashGraphNode, intermediate_data: any) -> None:
+        """Adds or reweights the transition from graph_node to next_graph_node."""
+
+        previous_intermediate_data = (
+            graph_node.get_intermediate_data_from(next_graph_node)
+            if next_graph_node in graph_node.nodes else None
+        )
+
+        graph_node.add_node(next_graph_node, intermediate_data)
+
+        if graph_node in self.__registered_nodes:
+            self.__incoming_nodes[next_graph_node].add(graph_node)
+
+        if (
+            self.__parents.get(next_graph_node) is graph_node
+            and previous_intermediate_data is not None
+            and intermediate_data > previous_intermediate_data
+        ):
+            self.__repair_subtree_of(next_graph_node)
+            return
+
+        next_distance = self.get_distance_to(graph_node) + intermediate_data
+
+        if next_distance < self.get_distance_to(next_graph_node):
+            self.__set_parent(next_graph_node, graph_node, next_distance)
+            self.__spread_decreases(PriorityQueue([((next_graph_node, next_distance), next_distance)]))
+
+    def cut_node(self, graph_node: HashGraphNode, next_graph_node: HashGraphNode) -> None:
+        """Removes the transition from graph_node to next_graph_node."""
+
+        graph_node.cut_node(next_graph_node)
+        self.__incoming_nodes[next_graph_node].discard(graph_node)
+
+        if self.__parents.get(next_graph_node) is graph_node:
+            self.__repair_subtree_of(next_graph_node)
+
+    def __spread_decreases(self, nodes_to_check: PriorityQueue) -> None:
+        while nodes_to_check:
+            active_node, distance = nodes_to_check.get()
+
+            if distance > self.get_distance_to(active_node):
+                continue
+
+            self.__register(active_node)
+
+            for next_node in active_node.nodes:
+                next_distance = distance + active_node.get_intermediate_data_from(next_node)
+
+                if next_distance < self.get_distance_to(next_node):
+                    self.__set_parent(next_node, active_node, next_distance)
+                    nodes_to_check.add((next_node, next_distance), next_distance)
+
+    def __repair_subtree_of(self, root_node: HashGraphNode) -> None:
+        affected_nodes = [root_node]
+
+        for affected_node in affected_nodes:
+            affected_nodes.extend(self.__children[affected_node])
+
+        affected_nodes = set(affected_nodes)
+
+        for affected_node in affected_nodes:
+            self.__children[self.__parents[affected_node]].discard(affected_node)
+            self.__parents[affected_node] = None
+            self.__distances[affected_node] = infinity
+
+        nodes_to_check = PriorityQueue()
+
+        for affected_node in affected_nodes:
+            for previous_node in self.__incoming_nodes[affected_node]:
+                if previous_node in affected_nodes:
+                    continue
+
+                distance = self.get_distance_to(previous_node) + previous_node.get_intermediate_data_from(affected_node)
+
+                if distance < self.__distances[affected_node]:
+                    self.__set_parent(affected_node, previous_node, distance)
+
+            if self.__distances[affected_node] != infinity:
+                nodes_to_check.add((affected_node, self.__distances[affected_node]), self.__distances[affected_node])
+
+        self.__spread_decreases(nodes_to_check)
+
+        for affected_node in affected_nodes:
+            if self.__distances[affected_node] == infinity:
+                del self.__distances[affected_node]
+                del self.__parents[affected_node]
+
+    def __set_parent(self, graph_node: HashGraphNode, parent_node: HashGraphNode, distance: float | int) -> None:
+        self.__children[self.__parents.get(graph_node)].discard(graph_node)
+        self.__children[parent_node].add(graph_node)
+        self.__parents[graph_node] = parent_node
+        self.__distances[graph_node] = distance
+
+    def __register(self, graph_node: HashGraphNode) -> None:
+        if graph_node in self.__registered_nodes:
+            return
+
+        self.__registered_nodes.add(graph_node)
+
+        for next_node in graph_node.nodes:
+            self.__incoming_nodes[next_node].add(graph_node)
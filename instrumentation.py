@@ -0,0 +1,126 @@
+from typing import Iterator, Callable
+from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+
+@dataclass
+class CallStatistics:
+    """
+    Statistics collected during one call of an instrumented function.
+    edges_relaxed counts every transition looked at from expanded nodes, whether
+    or not it improved a path.
+    """
+
+    function_name: str
+    nodes_expanded: int = 0
+    edges_relaxed: int = 0
+    peak_queue_size: int = 0
+    comparator_calls: int = 0
+    dp_cells_filled: int = 0
+    recursion_depth: int = 0
+    wall_time: float = 0
+
+    def note_queue_size(self, queue_size: int) -> None:
+        if queue_size > self.peak_queue_size:
+            self.peak_queue_size = queue_size
+
+    def note_recursion_depth(self, depth: int) -> None:
+        if depth > self.recursion_depth:
+            self.recursion_depth = depth
+
+
+_statistics_handlers: ContextVar[tuple[Callable[[CallStatistics], None],]] = ContextVar(
+    "statistics_handlers",
+    default=tuple()
+)
+_active_call_statistics: ContextVar[tuple[CallStatistics,]] = ContextVar("active_call_statistics", default=tuple())
+
+
+def instrumented(function: Callable) -> Callable:
+    """
+    Decorator that collects CallStatistics of each call of the input function and
+    passes them to the statistics handlers registered in the current thread or
+    asyncio task. When no handler is registered, costs one extra check per call
+    and nothing more.
+    """
+
+    @wraps(function)
+    def instrumented_function(*args, **kwargs) -> any:
+        statistics_handlers = _statistics_handlers.get()
+
+        if not statistics_handlers:
+            return function(*args, **kwargs)
+
+        statistics = CallStatistics(function.__name__)
+        active_call_token = _active_call_statistics.set((*_active_call_statistics.get(), statistics))
+        starting_time = perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            statistics.wall_time = perf_counter() - starting_time
+            _active_call_statistics.reset(active_call_token)
+
+            for handler in statistics_handlers:
+                handler(statistics)
+
+    return instrumented_function
+
+
+def get_active_call_statistics() -> CallStatistics | None:
+    """
+    Returns statistics of the innermost running instrumented call or None if
+    instrumentation is disabled. Calls running in other threads or asyncio tasks
+    have their own statistics.
+    """
+
+    active_call_statistics = _active_call_statistics.get()
+
+    return active_call_statistics[-1] if active_call_statistics else None
+
+
+def counting_comparator_calls(comparator: Callable, statistics: CallStatistics) -> Callable:
+    """Wraps the input comparator so that each of its calls is added to statistics."""
+
+    def counted_comparator(*args, **kwargs) -> any:
+        statistics.comparator_calls += 1
+        return comparator(*args, **kwargs)
+
+    return counted_comparator
+
+
+def add_statistics_handler(handler: Callable[[CallStatistics], None]) -> None:
+    """
+    Registers a callback called with CallStatistics after each instrumented call
+    made in the current thread or asyncio task, including the tasks it creates
+    afterwards.
+    """
+
+    _statistics_handlers.set((*_statistics_handlers.get(), handler))
+
+
+def remove_statistics_handler(handler: Callable[[CallStatistics], None]) -> None:
+    statistics_handlers = list(_statistics_handlers.get())
+    statistics_handlers.remove(handler)
+
+    _statistics_handlers.set(tuple(statistics_handlers))
+
+
+@contextmanager
+def collecting_statistics() -> Iterator[list[CallStatistics,]]:
+    """
+    Context manager enabling instrumentation within its body in the current
+    thread or asyncio task. Gives a list that is filled with CallStatistics of
+    each finished instrumented call.
+    """
+
+    collected_statistics = list()
+    add_statistics_handler(collected_statistics.append)
+
+    try:
+        yield collected_statistics
+    finally:
+        remove_statistics_handler(collected_statistics.append)
@@ -0,0 +1,264 @@
+from typing import Iterable
+from abc import ABC, abstractmethod
+
+from structures.graphs import AbstractGraphNode, get_reachable_nodes_from
+
+
+class IReachabilityIndex(ABC):
+    """
+    Describes a precomputed index answering whether one graph node can be reached
+    from another without searching for the path. Indexes the graph reachable from
+    the nodes given on initialization. Changes of the graph must be made through
+    add_node and cut_node of the index. Answers None instead of a boolean when the
+    index doesn't know the answer because the nodes are not indexed.
+    """
+
+    def __init__(self, graph_nodes: Iterable[AbstractGraphNode,]) -> None:
+        self._rebuild(graph_nodes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(nodes={len(self.nodes)})"
+
+    @property
+    @abstractmethod
+    def nodes(self) -> frozenset[AbstractGraphNode,]:
+        pass
+
+    @abstractmethod
+    def is_reachable(
+        self,
+        starting_graph_node: AbstractGraphNode,
+        final_graph_node: AbstractGraphNode
+    ) -> bool | None:
+        pass
+
+    @abstractmethod
+    def add_node(self, graph_node: AbstractGraphNode, next_graph_node: AbstractGraphNode, *args, **kwargs) -> None:
+        pass
+
+    def cut_node(self, graph_node: AbstractGraphNode, next_graph_node: AbstractGraphNode) -> None:
+        graph_node.cut_node(next_graph_node)
+        self._rebuild(self.nodes)
+
+    @abstractmethod
+    def _rebuild(self, graph_nodes: Iterable[AbstractGraphNode,]) -> None:
+        pass
+
+
+class UndirectedReachabilityIndex(IReachabilityIndex):
+    """
+    Reachability index for graphs whose transitions go both ways, based on
+    disjoint sets (union-find). Answers and adds transitions in almost O(1) speed,
+    cutting transitions rebuilds the index in O(n + e) speed.
+    """
+
+    @property
+    def nodes(self) -> frozenset[AbstractGraphNode,]:
+        return frozenset(self.__parents.keys())
+
+    def is_reachable(
+        self,
+        starting_graph_node: AbstractGraphNode,
+        final_graph_node: AbstractGraphNode
+    ) -> bool | None:
+        if starting_graph_node not in self.__parents or final_graph_node not in self.__parents:
+            return True if starting_graph_node is final_graph_node else None
+
+        return self.__find_root_of(starting_graph_node) is self.__find_root_of(final_graph_node)
+
+    def add_node(self, graph_node: AbstractGraphNode, next_graph_node: AbstractGraphNode, *args, **kwargs) -> None:
+        graph_node.add_node(next_graph_node, *args, **kwargs)
+
+        if next_graph_node not in self.__parents:
+            self.__add_component_of(next_graph_node)
+
+        if graph_node not in self.__parents:
+            self.__add_component_of(graph_node)
+
+        self.__unite(graph_node, next_graph_node)
+
+    def _rebuild(self, graph_nodes: Iterable[AbstractGraphNode,]) -> None:
+        self.__parents = dict()
+        self.__ranks = dict()
+
+        for graph_node in graph_nodes:
+            if graph_node not in self.__parents:
+                self.__add_component_of(graph_node)
+
+    def __add_component_of(self, graph_node: AbstractGraphNode) -> None:
+        new_nodes = get_reachable_nodes_from((graph_node, ), self.__parents.keys())
+
+        for node in new_nodes:
+            self.__parents[node] = node
+            self.__ranks[node] = 0
+
+        for node in new_nodes:
+            for next_node in node.nodes:
+                self.__unite(node, next_node)
+
+    def __find_root_of(self, graph_node: AbstractGraphNode) -> AbstractGraphNode:
+        while self.__parents[graph_node] is not graph_node:
+            self.__parents[graph_node] = self.__parents[self.__parents[graph_node]]
+            graph_node = self.__parents[graph_node]
+
+        return graph_node
+
+    def __unite(self, first_node: AbstractGraphNode, second_node: AbstractGraphNode) -> None:
+        first_root, second_root = self.__find_root_of(first_node), self.__find_root_of(second_node)
+
+        if first_root is second_root:
+            return
+
+        if self.__ranks[first_root] < self.__ranks[second_root]:
+            first_root, second_root = second_root, first_root
+
+        self.__parents[second_root] = first_root
+
+        if self.__ranks[first_root] == self.__ranks[second_root]:
+            self.__ranks[first_root] += 1
+
+
+class DirectedReachabilityIndex(IReachabilityIndex):
+    """
+    Reachability index for directed graphs. Condenses strongly connected
+    components, labels them in topological order and stores the set of components
+    reachable from each of them as a bit mask, so answers take O(1) speed.
+
+    Building takes O(n + e*c/w) speed and the masks take O(c*c) bits, where c is
+    the number of components and w is the machine word size. Adding a transition
+    that keeps the topological order updates the masks in O(c*c/w) speed, other
+    changes rebuild the index. Because of the full closure, fits graphs with a
+    moderate number of components (up to tens of thousands).
+    """
+
+    @property
+    def nodes(self) -> frozenset[AbstractGraphNode,]:
+        return frozenset(self.__component_by_node.keys())
+
+    def get_topological_label_of(self, graph_node: AbstractGraphNode) -> int:
+        """Label of the node component, less than the labels of the components it leads to."""
+
+        return self.__topological_labels[self.__component_by_node[graph_node]]
+
+    def is_reachable(
+        self,
+        starting_graph_node: AbstractGraphNode,
+        final_graph_node: AbstractGraphNode
+    ) -> bool | None:
+        if starting_graph_node not in self.__component_by_node:
+            return True if starting_graph_node is final_graph_node else None
+
+        if final_graph_node not in self.__component_by_node:
+            return False
+
+        starting_component = self.__component_by_node[starting_graph_node]
+        final_component = self.__component_by_node[final_graph_node]
+
+        if self.__topological_labels[starting_component] > self.__topological_labels[final_component]:
+            return False
+
+        return bool(self.__reachable_components[starting_component] >> final_component & 1)
+
+    def add_node(self, graph_node: AbstractGraphNode, next_graph_node: AbstractGraphNode, *args, **kwargs) -> None:
+        graph_node.add_node(next_graph_node, *args, **kwargs)
+
+        if graph_node not in self.__component_by_node:
+            self._rebuild((*self.nodes, graph_node))
+            return
+
+        if next_graph_node not in self.__component_by_node:
+            self._rebuild((*self.nodes, next_graph_node))
+            return
+
+        component = self.__component_by_node[graph_node]
+        next_component = self.__component_by_node[next_graph_node]
+
+        if self.__reachable_components[component] >> next_component & 1:
+            return
+
+        if self.__topological_labels[component] > self.__topological_labels[next_component]:
+            self._rebuild(self.nodes)
+            return
+
+        for other_component, reachable_components in enumerate(self.__reachable_components):
+            if reachable_components >> component & 1:
+                self.__reachable_components[other_component] |= self.__reachable_components[next_component]
+
+    def _rebuild(self, graph_nodes: Iterable[AbstractGraphNode,]) -> None:
+        self.__component_by_node = dict()
+        self.__reachable_components = list()
+
+        for graph_node in graph_nodes:
+            if graph_node not in self.__component_by_node:
+                self.__add_components_from(graph_node)
+
+        component_amount = len(self.__reachable_components)
+        self.__topological_labels = [component_amount - 1 - component for component in range(component_amount)]
+
+    def __add_components_from(self, graph_node: AbstractGraphNode) -> None:
+        """
+        Finds strongly connected components by Tarjan's algorithm without
+        recursion. Components are numbered in the order they are closed, so each
+        component can only lead to components with smaller numbers.
+        """
+
+        indexes, low_links = dict(), dict()
+        component_stack, on_stack = list(), set()
+        call_stack = [(graph_node, iter(graph_node.nodes))]
+        indexes[graph_node] = low_links[graph_node] = 0
+        component_stack.append(graph_node)
+        on_stack.add(graph_node)
+
+        while call_stack:
+            active_node, next_nodes = call_stack[-1]
+            next_node = next(next_nodes, None)
+
+            if next_node is not None:
+                if next_node in self.__component_by_node:
+                    continue
+
+                if next_node not in indexes:
+                    indexes[next_node] = low_links[next_node] = len(indexes)
+                    component_stack.append(next_node)
+                    on_stack.add(next_node)
+                    call_stack.append((next_node, iter(next_node.nodes)))
+
+                elif next_node in on_stack:
+                    low_links[active_node] = min(low_links[active_node], indexes[next_node])
+
+                continue
+
+            call_stack.pop()
+
+            if call_stack:
+                parent_node = call_stack[-1][0]
+                low_links[parent_node] = min(low_links[parent_node], low_links[active_node])
+
+            if low_links[active_node] == indexes[active_node]:
+                self.__close_component_at(active_node, component_stack, on_stack)
+
+    def __close_component_at(
+        self,
+        root_node: AbstractGraphNode,
+        component_stack: list[AbstractGraphNode,],
+        on_stack: set[AbstractGraphNode,]
+    ) -> None:
+        component = len(self.__reachable_components)
+        component_nodes = list()
+
+        while not component_nodes or component_nodes[-1] is not root_node:
+            component_nodes.append(component_stack.pop())
+            on_stack.discard(component_nodes[-1])
+            self.__component_by_node[component_nodes[-1]] = component
+
+        reachable_components = 1 << component
+
+        for node in component_nodes:
+            for next_node in node.nodes:
+                next_component = self.__component_by_node[next_node]
+
+                if next_component != component:
+                    reachable_components |= self.__reachable_components[next_component]
+
+        self.__reachable_components.append(reachable_components)
+
@@ -4,8 +4,10 @@ from collections import OrderedDict
 
 from structures.graphs import AbstractGraphNode, GraphNode, HashGraphNode, GraphPath
 from structures.data_types import ItemDescription, DistanceToItem
-from structures.collections_ import Queue
+from structures.collections_ import Queue, PriorityQueue
 from sorting import qsort
+from reachability import IReachabilityIndex
+from instrumentation import instrumented, get_active_call_statistics, counting_comparator_calls
 
 
 def binary_search_index_of(number: int, sorted_array: Iterable[int,]) -> int:
@@ -65,28 +67,57 @@ def get_biggest_from(numbers: Iterable[int,]) -> int:
     return bigest
 
 
-def breadth_first_search(starting_node_graph: AbstractGraphNode, final_node_graph: AbstractGraphNode) -> GraphPath | None:
+@instrumented
+def breadth_first_search(
+    starting_node_graph: AbstractGraphNode,
+    final_node_graph: AbstractGraphNode,
+    reachability_index: IReachabilityIndex | None = None,
+) -> GraphPath | None:
     """
     Searches for a path from one graph node to another, spending the minimum number of steps.
     Returns None if no path exists, otherwise abstract graph of the path. O(n) speed.
+    With the input reachability_index, returns None without searching when the
+    index knows that the final node cannot be reached. When the starting node is
+    the final one, the path is a cycle, so the index is asked whether the
+    starting node can be reached from its neighboring nodes.
     """
 
+    if reachability_index is not None and _is_unreachable_by(
+        reachability_index,
+        starting_node_graph,
+        final_node_graph
+    ):
+        return None
+
+    statistics = get_active_call_statistics()
     paths_to_nodes = Queue(map(lambda node: GraphPath(starting_node_graph, [node.data]), starting_node_graph.nodes))
 
+    if statistics is not None:
+        statistics.nodes_expanded += 1
+        statistics.edges_relaxed += len(paths_to_nodes)
+        statistics.note_queue_size(len(paths_to_nodes))
+
     while paths_to_nodes:
         active_path = paths_to_nodes.get()
 
         if active_path.final_node is final_node_graph:
             return active_path
         else:
+            next_nodes = active_path.final_node.nodes
             paths_to_nodes.add_from(
                 map(
                     lambda next_node: GraphPath(starting_node_graph, [*active_path.intermediate_keys, next_node.data]),
-                    active_path.final_node.nodes
+                    next_nodes
                 )
             )
 
+            if statistics is not None:
+                statistics.nodes_expanded += 1
+                statistics.edges_relaxed += len(next_nodes)
+                statistics.note_queue_size(len(paths_to_nodes))
+
 
+@instrumented
 def get_optinal_paths_to_graph_nodes(
     starting_graph_node: GraphNode,
     path_comparison_function: Callable | None = None,
@@ -107,9 +138,17 @@ def get_optinal_paths_to_graph_nodes(
                 first_path if sum(first_path.get_all_intermediate_data()) < sum(second_path.get_all_intermediate_data()) else second_path
             )
 
+    statistics = get_active_call_statistics()
+
+    if statistics is not None:
+        path_comparison_function = counting_comparator_calls(path_comparison_function, statistics)
+
     shortest_path_to_node = dict()
     paths_to_check = Queue([GraphPath(starting_graph_node, tuple())])
 
+    if statistics is not None:
+        statistics.note_queue_size(len(paths_to_check))
+
     while paths_to_check:
         update_branch = True
         active_path = paths_to_check.get()
@@ -126,16 +165,115 @@ def get_optinal_paths_to_graph_nodes(
             shortest_path_to_node[active_path.final_node] = active_path
 
         if update_branch:
+            next_nodes = active_path.final_node.nodes
             paths_to_check.add_from(
                 map(
                     lambda next_node: GraphPath(starting_graph_node, [*active_path.intermediate_keys, next_node.data]),
-                    active_path.final_node.nodes
+                    next_nodes
                 )
             )
 
+            if statistics is not None:
+                statistics.nodes_expanded += 1
+                statistics.edges_relaxed += len(next_nodes)
+                statistics.note_queue_size(len(paths_to_check))
+
     return shortest_path_to_node
 
 
+@instrumented
+def a_star_search(
+    starting_graph_node: AbstractGraphNode,
+    final_graph_node: AbstractGraphNode,
+    get_heuristic_distance_by_node: Callable[[AbstractGraphNode], float | int],
+    get_distance_between: Callable[[AbstractGraphNode, AbstractGraphNode], float | int] | None = None,
+    heuristic_weight: float | int = 1,
+) -> GraphPath | None:
+    """
+    Searches for the shortest path from one graph node to another, expanding first
+    the nodes with the smallest sum of the distance already covered and the
+    distance to final_graph_node estimated by the input function
+    get_heuristic_distance_by_node. By default, get_distance_between takes the
+    distance from intermediate data of HashGraphNodes and considers each
+    transition between other nodes to cost 1.
+
+    Returns None if no path exists, otherwise abstract graph of the path. Already
+    expanded nodes are expanded again when a shorter path to them is found, so the
+    path is optimal when the heuristic never overestimates the remaining distance.
+    heuristic_weight greater than 1 turns the search into weighted A*, which
+    expands fewer nodes and returns a path at most heuristic_weight times longer
+    than the optimal one. O(n*log(n)*h) speed for a consistent heuristic, which
+    never requires expanding a node again, where h is the speed of the input
+    function get_heuristic_distance_by_node.
+    """
+
+    if not get_distance_between:
+        get_distance_between = (
+            lambda node, next_node:
+                node.get_intermediate_data_from(next_node) if isinstance(node, HashGraphNode) else 1
+        )
+
+    statistics = get_active_call_statistics()
+
+    parent_by_node = {starting_graph_node: None}
+    distance_to_node = {starting_graph_node: 0}
+    closed_nodes = set()
+    nodes_to_check = PriorityQueue([(
+        starting_graph_node,
+        heuristic_weight * get_heuristic_distance_by_node(starting_graph_node)
+    )])
+
+    if statistics is not None:
+        statistics.note_queue_size(len(nodes_to_check))
+
+    while nodes_to_check:
+        active_node = nodes_to_check.get()
+
+        if active_node in closed_nodes:
+            continue
+
+        if active_node is final_graph_node:
+            return _get_path_by_parents(starting_graph_node, final_graph_node, parent_by_node)
+
+        closed_nodes.add(active_node)
+        next_nodes = active_node.nodes
+
+        for next_node in next_nodes:
+            next_distance = distance_to_node[active_node] + get_distance_between(active_node, next_node)
+
+            if next_distance < distance_to_node.get(next_node, infinity):
+                distance_to_node[next_node] = next_distance
+                parent_by_node[next_node] = active_node
+                closed_nodes.discard(next_node)
+                nodes_to_check.add(
+                    next_node,
+                    next_distance + heuristic_weight * get_heuristic_distance_by_node(next_node)
+                )
+
+        if statistics is not None:
+            statistics.nodes_expanded += 1
+            statistics.edges_relaxed += len(next_nodes)
+            statistics.note_queue_size(len(nodes_to_check))
+
+
+def get_heuristic_by_coordinates(
+    final_graph_node: AbstractGraphNode,
+    get_coordinates_by_node: Callable[[AbstractGraphNode], Iterable[float | int,]]
+) -> Callable[[AbstractGraphNode], float]:
+    """
+    Returns a heuristic function for a_star_search that estimates the distance
+    from a node to final_graph_node as the straight-line distance between their
+    coordinates given by the input get_coordinates_by_node function.
+    """
+
+    final_node_coordinates = tuple(get_coordinates_by_node(final_graph_node))
+
+    return lambda node: sqrt(sum(map(
+        lambda coordinate: coordinate**2,
+        _get_vector_by(get_coordinates_by_node(node), final_node_coordinates)
+    )))
+
+
 def choose_items_from(
     items: Iterable,
     sorted_function: Callable,
@@ -164,6 +302,7 @@ def choose_items_from(
     return chosen_items
 
 
+@instrumented
 def choose_maximum_items_from(
     items: set,
     cost_ceiling: int,
@@ -194,6 +333,7 @@ def choose_maximum_items_from(
     minimal_cost = min(map(lambda decription: decription.cost, base_item_decriptions))
     available_costs = [i * minimal_cost for i in range(1, ceil(cost_ceiling / minimal_cost) + 1)]
 
+    statistics = get_active_call_statistics()
     table = OrderedDict()
 
     for base_decription_index, base_decription in enumerate(base_item_decriptions):
@@ -235,6 +375,9 @@ def choose_maximum_items_from(
                 )
             )
 
+            if statistics is not None:
+                statistics.dp_cells_filled += 1
+
     return tuple(table.items())[-1][1][-1]
 
 
@@ -278,6 +421,20 @@ def get_nearest_items_for(
     )
 
 
+def _is_unreachable_by(
+    reachability_index: IReachabilityIndex,
+    starting_graph_node: AbstractGraphNode,
+    final_graph_node: AbstractGraphNode
+) -> bool:
+    if starting_graph_node is not final_graph_node:
+        return reachability_index.is_reachable(starting_graph_node, final_graph_node) is False
+
+    return all(
+        reachability_index.is_reachable(next_node, final_graph_node) is False
+        for next_node in starting_graph_node.nodes
+    )
+
+
 def _get_vector_by(start_point: Iterable[float | int,], end_point: Iterable[float | int,]) -> list[float | int,]:
     start_point, end_point = map(list, (start_point, end_point))
 
@@ -290,3 +447,18 @@ def _get_vector_by(start_point: Iterable[float | int,], end_point: Iterable[floa
         coordinate_of_end_point - coordinate_of_start_point
         for coordinate_of_start_point, coordinate_of_end_point in zip(start_point, end_point)
     ]
+
+
+def _get_path_by_parents(
+    starting_graph_node: AbstractGraphNode,
+    final_graph_node: AbstractGraphNode,
+    parent_by_node: dict[AbstractGraphNode, AbstractGraphNode | None]
+) -> GraphPath:
+    intermediate_keys = list()
+    active_node = final_graph_node
+
+    while active_node is not starting_graph_node:
+        intermediate_keys.append(active_node.data)
+        active_node = parent_by_node[active_node]
+
+    return GraphPath(starting_graph_node, reversed(intermediate_keys))
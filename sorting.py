@@ -1,6 +1,9 @@
 from typing import Iterable, Callable
 
+from instrumentation import instrumented, get_active_call_statistics, counting_comparator_calls, CallStatistics
 
+
+@instrumented
 def qsort(
     items: list,
     determinant_function: Callable = lambda first, second: "middle" if first == second else first > second
@@ -16,6 +19,23 @@ def qsort(
     a list of numbers from smallest to largest. O(n) speed.
     """
 
+    statistics = get_active_call_statistics()
+
+    if statistics is not None:
+        determinant_function = counting_comparator_calls(determinant_function, statistics)
+
+    return _recursive_qsort(items, determinant_function, statistics)
+
+
+def _recursive_qsort(
+    items: list,
+    determinant_function: Callable,
+    statistics: CallStatistics | None,
+    depth: int = 1
+) -> list:
+    if statistics is not None:
+        statistics.note_recursion_depth(depth)
+
     match len(items):
         case 2 if not determinant_function(*items):
             items.reverse()
@@ -37,9 +57,9 @@ def qsort(
                 raise ValueError(f'Determinant function must return "middle", "right", "left" or boolean value, not {result}')
 
     return (
-        qsort(left_part, determinant_function) +
+        _recursive_qsort(left_part, determinant_function, statistics, depth + 1) +
         middle_part +
-        qsort(right_part, determinant_function)
+        _recursive_qsort(right_part, determinant_function, statistics, depth + 1)
     )
 
 def bubble_sort(numbers: Iterable) -> None:
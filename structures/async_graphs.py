@@ -0,0 +1,179 @@
+from typing import Iterable
+from abc import ABC, abstractmethod
+from asyncio import Semaphore, gather, sleep
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+from structures.graphs import HashGraphNode
+from errors import NotLoadedGraphNode
+
+
+class IAdjacencyStore(ABC):
+    """
+    Describes a storage of graph adjacency: for the data of a node, gives the
+    data of its neighboring nodes with the intermediate data of the transitions
+    to them.
+    """
+
+    @abstractmethod
+    async def get_adjacency_by(self, keys: tuple) -> dict[any, dict[any, any]]:
+        pass
+
+
+class MemoryAdjacencyStore(IAdjacencyStore):
+    """Adjacency store keeping everything in memory, simulating I/O by delay."""
+
+    def __init__(self, adjacency: dict[any, dict[any, any]], delay: float = 0) -> None:
+        self.__adjacency = {key: dict(neighbours) for key, neighbours in adjacency.items()}
+        self.__delay = delay
+        self.fetch_counter = 0
+
+    async def get_adjacency_by(self, keys: tuple) -> dict[any, dict[any, any]]:
+        self.fetch_counter += 1
+        await sleep(self.__delay)
+
+        return {key: dict(self.__adjacency.get(key, dict())) for key in keys}
+
+
+class AsyncGraphNode(HashGraphNode):
+    """
+    HashGraphNode whose neighboring nodes live in an adjacency store and become
+    available after they are loaded by its AsyncGraphNodeLoader. Forgets them
+    again when the loader drops its adjacency from the cache.
+    """
+
+    def __init__(self, data: any, loader: "AsyncGraphNodeLoader") -> None:
+        super().__init__(data)
+        self.__loader = loader
+        self.__is_loaded = False
+
+    def __repr__(self) -> str:
+        if not self.is_loaded:
+            return f"{self.__class__.__name__}(main_data={self.data}, is_loaded=False)"
+
+        return super().__repr__()
+
+    @property
+    def loader(self) -> "AsyncGraphNodeLoader":
+        return self.__loader
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__is_loaded
+
+    @property
+    def nodes(self) -> frozenset:
+        if not self.is_loaded:
+            raise NotLoadedGraphNode(data=self.data)
+
+        return super().nodes
+
+    def get_intermediate_data_from(self, graph_node: HashGraphNode) -> any:
+        if not self.is_loaded:
+            raise NotLoadedGraphNode(data=self.data)
+
+        return super().get_intermediate_data_from(graph_node)
+
+    async def load_nodes(self) -> frozenset:
+        await self.__loader.load_nodes_of((self, ))
+        return self.nodes
+
+    def _set_adjacency(self, adjacency: dict[any, any]) -> None:
+        for node_data, intermediate_data in adjacency.items():
+            super().add_node(self.__loader.get_node(node_data), intermediate_data)
+
+        self.__is_loaded = True
+
+    def _unload(self) -> None:
+        for node in tuple(super().nodes):
+            super().cut_node(node)
+
+        self.__is_loaded = False
+
+
+class AsyncGraphNodeLoader:
+    """
+    Creates AsyncGraphNodes and loads their neighboring nodes from the adjacency
+    store. Keeps no more than cache_size recently loaded nodes loaded, unloading
+    the least recently used ones, so nodes are kept in memory only while
+    something else refers to them. Nodes requested by one load_nodes_of call are
+    never unloaded by the same call, so it may exceed cache_size for a while.
+    Fetches the missing adjacency in batches of
+    batch_size keys and runs no more than max_concurrent_fetches fetches at the
+    same time.
+    """
+
+    def __init__(
+        self,
+        store: IAdjacencyStore,
+        cache_size: int = 1024,
+        batch_size: int = 64,
+        max_concurrent_fetches: int = 8
+    ) -> None:
+        self.__store = store
+        self.__cache_size = cache_size
+        self.__batch_size = batch_size
+        self.__fetch_semaphore = Semaphore(max_concurrent_fetches)
+        self.__adjacency_cache = OrderedDict()
+        self.__nodes = WeakValueDictionary()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(store={self.__store}, cached={len(self.__adjacency_cache)})"
+
+    @property
+    def cache_size(self) -> int:
+        return self.__cache_size
+
+    def get_node(self, data: any) -> AsyncGraphNode:
+        node = self.__nodes.get(data)
+
+        if node is None:
+            node = AsyncGraphNode(data, self)
+            self.__nodes[data] = node
+
+        return node
+
+    async def load_nodes_of(self, graph_nodes: Iterable[AsyncGraphNode,]) -> None:
+        nodes_to_load = {node.data: node for node in graph_nodes}
+        missing_keys = list()
+
+        for key, node in nodes_to_load.items():
+            if key in self.__adjacency_cache:
+                self.__adjacency_cache.move_to_end(key)
+
+                if not node.is_loaded:
+                    node._set_adjacency(self.__adjacency_cache[key])
+            else:
+                missing_keys.append(key)
+
+        batches_of_adjacency = await gather(*(
+            self.__fetch(tuple(missing_keys[batch_start:batch_start + self.__batch_size]))
+            for batch_start in range(0, len(missing_keys), self.__batch_size)
+        ))
+
+        for adjacency in batches_of_adjacency:
+            for key, neighbours in adjacency.items():
+                self.__remember(key, neighbours, nodes_to_load.keys())
+
+                if not nodes_to_load[key].is_loaded:
+                    nodes_to_load[key]._set_adjacency(neighbours)
+
+    async def __fetch(self, keys: tuple) -> dict[any, dict[any, any]]:
+        async with self.__fetch_semaphore:
+            return await self.__store.get_adjacency_by(keys)
+
+    def __remember(self, key: any, neighbours: dict[any, any], pinned_keys: Iterable) -> None:
+        self.__adjacency_cache[key] = neighbours
+        self.__adjacency_cache.move_to_end(key)
+
+        while len(self.__adjacency_cache) > self.__cache_size:
+            forgotten_key = next(iter(self.__adjacency_cache))
+
+            if forgotten_key in pinned_keys:
+                break
+
+            del self.__adjacency_cache[forgotten_key]
+            forgotten_node = self.__nodes.get(forgotten_key)
+
+            if forgotten_node is not None:
+                forgotten_node._unload()
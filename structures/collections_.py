@@ -1,4 +1,6 @@
 from typing import Iterable
+from heapq import heappush, heappop
+from itertools import count
 
 
 class Queue:
@@ -26,3 +28,29 @@ class Queue:
     def add_from(self, data: tuple) -> None:
         for object_ in data:
             self.add(object_)
+
+
+class PriorityQueue:
+    """Queue giving first the object with the smallest priority."""
+
+    def __init__(self, data: Iterable[tuple[any, float | int],] = tuple()):
+        self.__objects = list()
+        self.__addition_counter = count()
+
+        for object_, priority in data:
+            self.add(object_, priority)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(len={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __bool__(self) -> bool:
+        return bool(self.__objects)
+
+    def get(self) -> any:
+        return heappop(self.__objects)[-1]
+
+    def add(self, data: any, priority: float | int) -> None:
+        heappush(self.__objects, (priority, next(self.__addition_counter), data))
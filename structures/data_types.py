@@ -59,3 +59,15 @@ class ItemDescription():
 class DistanceToItem(NamedTuple):
     item: any
     distance: float | int
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+
+
+class DistanceMatrix(NamedTuple):
+    starting_nodes: tuple
+    nodes: tuple
+    distances: tuple
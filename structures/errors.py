@@ -28,3 +28,9 @@ class NoNextGraphNode(_StructuredException, GraphNodeError):
     """Error caused by the incorrect sequence of keys of the abstract graph (path)."""
 
     default_text = "Graph node {node} ({node_index} index) has no node with data {data}"
+
+
+class NotLoadedGraphNode(_StructuredException, GraphNodeError):
+    """Error caused by accessing neighboring nodes of a node that has not loaded them yet."""
+
+    default_text = "Graph node with data {data} has not loaded its nodes"
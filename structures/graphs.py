@@ -10,10 +10,17 @@ class AbstractGraphNode(ABC):
     other parts of the graph and they can be obtained by referring to the node
     with the key as their data. Preserves neighboring graph nodes and leaves
     persistence implementation to descendants.
+
+    Each change of neighboring nodes increases the node version and the version
+    shared by all graphs, which allows to detect changes of the graph without
+    traversing it again.
     """
 
+    _graph_version = 0
+
     def __init__(self, data: any) -> None:
         self.data = data
+        self.__version = 0
 
     def __repr__(self) -> str:
         return "{class_name}(main_data={main_data}, nodes_data={nodes_data})".format(
@@ -29,6 +36,18 @@ class AbstractGraphNode(ABC):
 
         raise NoGraphNodeReference(node=self, data=node_data)
 
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    @staticmethod
+    def get_graph_version() -> int:
+        return AbstractGraphNode._graph_version
+
+    def _update_version(self) -> None:
+        self.__version += 1
+        AbstractGraphNode._graph_version += 1
+
     @property
     @abstractmethod
     def nodes(self) -> frozenset:
@@ -56,9 +75,11 @@ class GraphNode(AbstractGraphNode):
 
     def add_node(self, graph_node: AbstractGraphNode) -> None:
         self.__nodes.add(graph_node)
+        self._update_version()
 
     def cut_node(self, graph_node: AbstractGraphNode) -> None:
         self.__nodes.remove(graph_node)
+        self._update_version()
 
 
 class HashGraphNode(AbstractGraphNode):
@@ -80,9 +101,11 @@ class HashGraphNode(AbstractGraphNode):
 
     def add_node(self, graph_node: AbstractGraphNode, intermediate_data: any) -> None:
         self.__nodes[graph_node] = intermediate_data
+        self._update_version()
 
     def cut_node(self, graph_node: AbstractGraphNode) -> None:
         self.__nodes.pop(graph_node)
+        self._update_version()
 
 
 class AbstractBinaryGraphNode(AbstractGraphNode):
@@ -121,11 +144,13 @@ class AbstractBinaryGraphNode(AbstractGraphNode):
             case "left":
                 if self.__left_node is None:
                     self.__left_node = graph_node
+                    self._update_version()
                 else:
                     self.__left_node.add_node(graph_node)
             case "right":
                 if self.__right_node is None:
                     self.__right_node = graph_node
+                    self._update_version()
                 else:
                     self.__right_node.add_node(graph_node)
             case _ as result:
@@ -141,6 +166,8 @@ class AbstractBinaryGraphNode(AbstractGraphNode):
             case _:
                 raise KeyError(graph_node)
 
+        self._update_version()
+
 
 class UserBinaryGraphNode(AbstractBinaryGraphNode):
     """Class taking determinant_function from the client."""
@@ -349,3 +376,30 @@ class GraphPath:
     @property
     def final_node(self) -> AbstractGraphNode:
         return self.__final_node
+
+
+def get_reachable_nodes_from(
+    graph_nodes: Iterable[AbstractGraphNode,],
+    known_nodes: Iterable[AbstractGraphNode,] = tuple()
+) -> list[AbstractGraphNode,]:
+    """
+    Returns the input nodes and all nodes reachable from them in breadth-first
+    order, not passing through known_nodes. O(n + e) speed, where e is the number
+    of transitions.
+    """
+
+    known_nodes = set(known_nodes)
+    reachable_nodes = list()
+
+    for graph_node in graph_nodes:
+        if graph_node not in known_nodes:
+            known_nodes.add(graph_node)
+            reachable_nodes.append(graph_node)
+
+    for active_node in reachable_nodes:
+        for next_node in active_node.nodes:
+            if next_node not in known_nodes:
+                known_nodes.add(next_node)
+                reachable_nodes.append(next_node)
+
+    return reachable_nodes